@@ -1,5 +1,7 @@
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Optional
 
 from scrum_master.agents.meet_agent.core.config import settings
@@ -22,12 +24,18 @@ def _log_meeting_data(meeting_data: dict) -> None:
     logger.info("=" * 80)
 
 
-def _get_jira_service() -> JiraService:
+@asynccontextmanager
+async def _jira_service() -> AsyncIterator[JiraService]:
+    # Tools run outside the DI container and on whatever loop the agent uses,
+    # so each call owns its pooled client and closes it when done
     client = JiraClient(
         url=settings.jira.api_url,
         token=settings.jira.api_token.get_secret_value(),
     )
-    return JiraService(client)
+    try:
+        yield JiraService(client)
+    finally:
+        await client.aclose()
 
 
 async def create_jira_issue(
@@ -40,21 +48,20 @@ async def create_jira_issue(
 ) -> dict:
     try:
         logger.info(f"[TOOL] Creating Jira issue: {summary}")
-        service = _get_jira_service()
-        
-        request = CreateIssueRequest(
-            project_key=settings.jira.project_key,
-            summary=summary,
-            description=description,
-            assignee=assignee,
-            issue_type=issue_type,
-            priority=priority,
-            duedate=duedate,
-        )
+        async with _jira_service() as service:
+            request = CreateIssueRequest(
+                project_key=settings.jira.project_key,
+                summary=summary,
+                description=description,
+                assignee=assignee,
+                issue_type=issue_type,
+                priority=priority,
+                duedate=duedate,
+            )
         
-        result = await service.create_issue(request)
-        logger.info(f"[TOOL] Jira issue created: {result}")
-        return {"status": "success", "data": result}
+            result = await service.create_issue(request)
+            logger.info(f"[TOOL] Jira issue created: {result}")
+            return {"status": "success", "data": result}
     except Exception as e:
         logger.error(f"[TOOL] Failed to create Jira issue: {e}")
         return {"status": "error", "message": str(e)}
@@ -81,19 +88,18 @@ async def update_jira_issue(
     """
     try:
         logger.info(f"[TOOL] Updating Jira issue: {issue_key}")
-        service = _get_jira_service()
-        
-        request = UpdateIssueRequest(
-            summary=summary,
-            description=description,
-            assignee=assignee,
-            priority=priority,
-            duedate=duedate,
-        )
+        async with _jira_service() as service:
+            request = UpdateIssueRequest(
+                summary=summary,
+                description=description,
+                assignee=assignee,
+                priority=priority,
+                duedate=duedate,
+            )
         
-        result = await service.update_issue(issue_key, request)
-        logger.info(f"[TOOL] Jira issue updated: {result}")
-        return {"status": "success", "data": result}
+            result = await service.update_issue(issue_key, request)
+            logger.info(f"[TOOL] Jira issue updated: {result}")
+            return {"status": "success", "data": result}
     except Exception as e:
         logger.error(f"[TOOL] Failed to update Jira issue: {e}")
         return {"status": "error", "message": str(e)}
@@ -118,21 +124,20 @@ async def create_jira_epic(
     """
     try:
         logger.info(f"[TOOL] Creating Jira epic: {epic_name}")
-        service = _get_jira_service()
-
-        request = CreateIssueRequest(
-            project_key=settings.jira.project_key,
-            summary=summary,
-            description=description,
-            issue_type="Epic",
-            priority=priority,
-            duedate=duedate,
-            epic_name=epic_name,
-        )
-
-        result = await service.create_issue(request)
-        logger.info(f"[TOOL] Jira epic created: {result}")
-        return {"status": "success", "data": result}
+        async with _jira_service() as service:
+            request = CreateIssueRequest(
+                project_key=settings.jira.project_key,
+                summary=summary,
+                description=description,
+                issue_type="Epic",
+                priority=priority,
+                duedate=duedate,
+                epic_name=epic_name,
+            )
+
+            result = await service.create_issue(request)
+            logger.info(f"[TOOL] Jira epic created: {result}")
+            return {"status": "success", "data": result}
     except Exception as e:
         logger.error(f"[TOOL] Failed to create Jira epic: {e}")
         return {"status": "error", "message": str(e)}
@@ -159,22 +164,21 @@ async def create_jira_subtask(
     """
     try:
         logger.info(f"[TOOL] Creating Jira subtask under {parent_key}: {summary}")
-        service = _get_jira_service()
-
-        request = CreateIssueRequest(
-            project_key=settings.jira.project_key,
-            summary=summary,
-            description=description,
-            assignee=assignee,
-            issue_type="Sub-task",
-            priority=priority,
-            duedate=duedate,
-            parent_key=parent_key,
-        )
-
-        result = await service.create_issue(request)
-        logger.info(f"[TOOL] Jira subtask created: {result}")
-        return {"status": "success", "data": result}
+        async with _jira_service() as service:
+            request = CreateIssueRequest(
+                project_key=settings.jira.project_key,
+                summary=summary,
+                description=description,
+                assignee=assignee,
+                issue_type="Sub-task",
+                priority=priority,
+                duedate=duedate,
+                parent_key=parent_key,
+            )
+
+            result = await service.create_issue(request)
+            logger.info(f"[TOOL] Jira subtask created: {result}")
+            return {"status": "success", "data": result}
     except Exception as e:
         logger.error(f"[TOOL] Failed to create Jira subtask: {e}")
         return {"status": "error", "message": str(e)}
@@ -198,146 +202,148 @@ async def process_meeting_tasks_to_jira(meeting_data: dict) -> dict:
         _log_meeting_data(meeting_data)
 
         logger.info("[TOOL] Processing meeting tasks to Jira")
-        service = _get_jira_service()
-
-        tasks = meeting_data.get("tasks", [])
-        project_complexity = meeting_data.get("project_complexity", "simple")
-        created_issues = []
-        epic_key = None
-
-        # STEP 1: Create Epic if project is complex enough
-        if project_complexity == "epic" and "epic" in meeting_data:
-            epic_info = meeting_data["epic"]
+        async with _jira_service() as service:
+            tasks = meeting_data.get("tasks", [])
+            project_complexity = meeting_data.get("project_complexity", "simple")
+            created_issues = []
+            epic_key = None
+
+            # STEP 1: Create Epic if project is complex enough
+            if project_complexity == "epic" and "epic" in meeting_data:
+                epic_info = meeting_data["epic"]
             
-            epic_summary = epic_info.get("title", "Project Epic")
-            epic_description = epic_info.get("description", "")
+                epic_summary = epic_info.get("title", "Project Epic")
+                epic_description = epic_info.get("description", "")
             
-            # Add meeting summary to epic description
-            if "summary" in meeting_data:
-                epic_description += f"\n\n**Meeting Summary:**\n{meeting_data['summary'].get('description', '')}"
+                # Add meeting summary to epic description
+                if "summary" in meeting_data:
+                    summary_description = meeting_data['summary'].get('description', '')
+                    epic_description += f"\n\n**Meeting Summary:**\n{summary_description}"
                 
-                for topic in meeting_data.get("summary", {}).get("topics", []):
-                    epic_description += f"\n\n**{topic.get('title', '')}**\n{topic.get('description', '')}"
+                    for topic in meeting_data.get("summary", {}).get("topics", []):
+                        epic_description += f"\n\n**{topic.get('title', '')}**\n{topic.get('description', '')}"
 
-            priority_map = {"high": "High", "medium": "Medium", "low": "Low"}
+                priority_map = {"high": "High", "medium": "Medium", "low": "Low"}
             
-            epic_request = CreateIssueRequest(
-                project_key=settings.jira.project_key,
-                summary=epic_summary,
-                description=epic_description,
-                issue_type="Epic",
-                epic_name=epic_summary[:50],  # Epic name has character limit
-                priority=priority_map.get(epic_info.get("priority", "medium"), "Medium"),
-                duedate=epic_info.get("deadline"),
-            )
+                epic_request = CreateIssueRequest(
+                    project_key=settings.jira.project_key,
+                    summary=epic_summary,
+                    description=epic_description,
+                    issue_type="Epic",
+                    epic_name=epic_summary[:50],  # Epic name has character limit
+                    priority=priority_map.get(epic_info.get("priority", "medium"), "Medium"),
+                    duedate=epic_info.get("deadline"),
+                )
 
-            epic_result = await service.create_issue(epic_request)
-            epic_key = epic_result.get("key")
-            created_issues.append({"type": "epic", "key": epic_key, "summary": epic_summary})
-            logger.info(f"[TOOL] Created epic: {epic_key}")
+                epic_result = await service.create_issue(epic_request)
+                epic_key = epic_result.get("key")
+                created_issues.append({"type": "epic", "key": epic_key, "summary": epic_summary})
+                logger.info(f"[TOOL] Created epic: {epic_key}")
 
-        # STEP 2: Group tasks by parent-child relationship
-        # Separate parent tasks from subtasks
-        parent_tasks = [t for t in tasks if t.get("task_type") != "subtask"]
-        subtasks = [t for t in tasks if t.get("task_type") == "subtask"]
+            # STEP 2: Group tasks by parent-child relationship
+            # Separate parent tasks from subtasks
+            parent_tasks = [t for t in tasks if t.get("task_type") != "subtask"]
+            subtasks = [t for t in tasks if t.get("task_type") == "subtask"]
         
-        # Create mapping to store parent task keys
-        task_title_to_key = {}
+            # Create mapping to store parent task keys
+            task_title_to_key = {}
 
-        # STEP 3: Create parent Tasks first
-        for task in parent_tasks:
-            task_description = _build_task_description(task)
-            priority = _map_priority(task.get("priority", "medium"))
+            # STEP 3: Create parent Tasks first
+            for task in parent_tasks:
+                task_description = _build_task_description(task)
+                priority = _map_priority(task.get("priority", "medium"))
 
-            request = CreateIssueRequest(
-                project_key=settings.jira.project_key,
-                summary=task.get("title", ""),
-                description=task_description,
-                assignee=None,
-                issue_type="Task",
-                priority=priority,
-                duedate=task.get("deadline"),
-            )
+                request = CreateIssueRequest(
+                    project_key=settings.jira.project_key,
+                    summary=task.get("title", ""),
+                    description=task_description,
+                    assignee=None,
+                    issue_type="Task",
+                    priority=priority,
+                    duedate=task.get("deadline"),
+                )
 
-            result = await service.create_issue(request)
-            task_key = result.get("key")
-            task_title_to_key[task.get("title")] = task_key
+                result = await service.create_issue(request)
+                task_key = result.get("key")
+                task_title_to_key[task.get("title")] = task_key
             
-            created_issues.append({
-                "type": "task",
-                "key": task_key,
-                "summary": task.get("title"),
-                "assignee": task.get("assignee")
-            })
-            logger.info(f"[TOOL] Created task: {task_key} - {task.get('title')}")
-
-        # STEP 4: Create Subtasks with parent linkage
-        for subtask in subtasks:
-            parent_title = subtask.get("parent_task_title")
-            parent_key = task_title_to_key.get(parent_title)
+                created_issues.append({
+                    "type": "task",
+                    "key": task_key,
+                    "summary": task.get("title"),
+                    "assignee": task.get("assignee")
+                })
+                logger.info(f"[TOOL] Created task: {task_key} - {task.get('title')}")
+
+            # STEP 4: Create Subtasks with parent linkage
+            for subtask in subtasks:
+                parent_title = subtask.get("parent_task_title")
+                parent_key = task_title_to_key.get(parent_title)
             
-            if not parent_key:
-                logger.warning(f"[TOOL] Parent task not found for subtask: {subtask.get('title')}. Creating as regular task instead.")
-                # Create as regular task if parent not found
+                if not parent_key:
+                    logger.warning(f"[TOOL] Parent task not found for subtask: {subtask.get('title')}. Creating as regular task instead.")
+                    # Create as regular task if parent not found
+                    task_description = _build_task_description(subtask)
+                    priority = _map_priority(subtask.get("priority", "medium"))
+                
+                    request = CreateIssueRequest(
+                        project_key=settings.jira.project_key,
+                        summary=subtask.get("title", ""),
+                        description=task_description,
+                        assignee=None,
+                        issue_type="Task",
+                        priority=priority,
+                        duedate=subtask.get("deadline"),
+                    )
+                    result = await service.create_issue(request)
+                    created_issues.append({
+                        "type": "task_fallback",
+                        "key": result.get("key"),
+                        "summary": subtask.get("title")
+                    })
+                    continue
+
+                # Create subtask with parent linkage
                 task_description = _build_task_description(subtask)
                 priority = _map_priority(subtask.get("priority", "medium"))
-                
+            
                 request = CreateIssueRequest(
                     project_key=settings.jira.project_key,
                     summary=subtask.get("title", ""),
                     description=task_description,
                     assignee=None,
-                    issue_type="Task",
+                    issue_type="Sub-task",
                     priority=priority,
                     duedate=subtask.get("deadline"),
+                    parent_key=parent_key,
                 )
+
                 result = await service.create_issue(request)
+                subtask_key = result.get("key")
                 created_issues.append({
-                    "type": "task_fallback",
-                    "key": result.get("key"),
-                    "summary": subtask.get("title")
+                    "type": "subtask",
+                    "key": subtask_key,
+                    "summary": subtask.get("title"),
+                    "parent": parent_key,
+                    "assignee": subtask.get("assignee")
                 })
-                continue
-
-            # Create subtask with parent linkage
-            task_description = _build_task_description(subtask)
-            priority = _map_priority(subtask.get("priority", "medium"))
-            
-            request = CreateIssueRequest(
-                project_key=settings.jira.project_key,
-                summary=subtask.get("title", ""),
-                description=task_description,
-                assignee=None,
-                issue_type="Sub-task",
-                priority=priority,
-                duedate=subtask.get("deadline"),
-                parent_key=parent_key,
-            )
+                logger.info(
+                    f"[TOOL] Created subtask: {subtask_key} under {parent_key} - {subtask.get('title')}"
+                )
 
-            result = await service.create_issue(request)
-            subtask_key = result.get("key")
-            created_issues.append({
-                "type": "subtask",
-                "key": subtask_key,
-                "summary": subtask.get("title"),
-                "parent": parent_key,
-                "assignee": subtask.get("assignee")
-            })
-            logger.info(f"[TOOL] Created subtask: {subtask_key} under {parent_key} - {subtask.get('title')}")
-
-        # STEP 5: Return summary
-        summary_msg = _create_summary_message(created_issues, epic_key)
-        logger.info(f"[TOOL] {summary_msg}")
+            # STEP 5: Return summary
+            summary_msg = _create_summary_message(created_issues, epic_key)
+            logger.info(f"[TOOL] {summary_msg}")
         
-        return {
-            "status": "success",
-            "message": summary_msg,
-            "data": {
-                "epic_key": epic_key,
-                "created_issues": created_issues,
-                "total_count": len(created_issues)
+            return {
+                "status": "success",
+                "message": summary_msg,
+                "data": {
+                    "epic_key": epic_key,
+                    "created_issues": created_issues,
+                    "total_count": len(created_issues)
+                }
             }
-        }
 
     except Exception as e:
         logger.error(f"[TOOL] Failed to process meeting tasks to Jira: {e}", exc_info=True)
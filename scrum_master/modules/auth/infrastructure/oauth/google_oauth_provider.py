@@ -16,10 +16,17 @@ class GoogleOAuthProvider(BaseOAuthProvider):
     TOKEN_URL = 'https://oauth2.googleapis.com/token'
     USERINFO_URL = 'https://www.googleapis.com/oauth2/v2/userinfo'
 
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        http_client: httpx.AsyncClient,
+    ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
+        self.http_client = http_client
         self.scopes = [
             'https://www.googleapis.com/auth/userinfo.email',
             'https://www.googleapis.com/auth/userinfo.profile',
@@ -40,55 +47,53 @@ class GoogleOAuthProvider(BaseOAuthProvider):
         return f'{self.AUTHORIZATION_URL}?{urlencode(params)}'
 
     async def exchange_code(self, code: str) -> str:
-        async with httpx.AsyncClient() as client:
-            payload = {
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-                'code': code,
-                'redirect_uri': self.redirect_uri,
-                'grant_type': 'authorization_code',
-            }
+        payload = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'code': code,
+            'redirect_uri': self.redirect_uri,
+            'grant_type': 'authorization_code',
+        }
 
-            response = await client.post(
-                self.TOKEN_URL,
-                data=payload,
-                headers={
-                    'Content-Type': 'application/x-www-form-urlencoded',
-                },
-            )
+        response = await self.http_client.post(
+            self.TOKEN_URL,
+            data=payload,
+            headers={
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+        )
 
-            if response.status_code != 200:
-                error_data = (
-                    response.json()
-                    if response.headers.get('content-type', '').startswith('application/json')
-                    else {'error': response.text}
-                )
-                raise ValueError(f'Google OAuth error: {error_data}')
+        if response.status_code != 200:
+            error_data = (
+                response.json()
+                if response.headers.get('content-type', '').startswith('application/json')
+                else {'error': response.text}
+            )
+            raise ValueError(f'Google OAuth error: {error_data}')
 
-            data = response.json()
-            logger.info(f'Google token data: {data}')
-            return data['access_token']
+        data = response.json()
+        logger.info(f'Google token data: {data}')
+        return data['access_token']
 
     async def get_user_info(self, access_token: str) -> OAuthUserInfo:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.USERINFO_URL,
-                headers={
-                    'Authorization': f'Bearer {access_token}',
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self.http_client.get(
+            self.USERINFO_URL,
+            headers={
+                'Authorization': f'Bearer {access_token}',
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            email = data.get('email')
-            if not email:
-                raise Exception('No email found in Google OAuth response')
+        email = data.get('email')
+        if not email:
+            raise Exception('No email found in Google OAuth response')
 
-            username = data.get('name') or email.split('@')[0]
+        username = data.get('name') or email.split('@')[0]
 
-            return OAuthUserInfo(
-                oauth_id=str(data['id']),
-                email=email,
-                username=username,
-                avatar_url=data.get('picture'),
-            )
\ No newline at end of file
+        return OAuthUserInfo(
+            oauth_id=str(data['id']),
+            email=email,
+            username=username,
+            avatar_url=data.get('picture'),
+        )
\ No newline at end of file
@@ -13,12 +13,13 @@ class RedisSessionRepository(ISessionRepository):
         self._redis = redis_client
         self._prefix = 'session'
         self._user_sessions_prefix = 'user_sessions'
+        self._batch_size = 500
 
-    def _get_session_key(self, session_id: UUID) -> str:
-        return f'{self._prefix}:{session_id!s}'
+    def _get_session_key(self, session_id: UUID | str) -> str:
+        return f'{self._prefix}:{session_id}'
 
-    def _get_user_sessions_key(self, user_id: UUID) -> str:
-        return f'{self._user_sessions_prefix}:{user_id!s}'
+    def _get_user_sessions_key(self, user_id: UUID | str) -> str:
+        return f'{self._user_sessions_prefix}:{user_id}'
 
     def _serialize_session(self, session: SessionData) -> str:
         return json.dumps({
@@ -31,7 +32,7 @@ class RedisSessionRepository(ISessionRepository):
             'expires_at': session.expires_at.isoformat(),
         })
 
-    def _deserialize_session(self, data: str) -> SessionData:
+    def _deserialize_session(self, data: bytes) -> SessionData:
         obj = json.loads(data)
         return SessionData(
             id=UUID(obj['id']),
@@ -44,7 +45,8 @@ class RedisSessionRepository(ISessionRepository):
         )
 
     async def create(self, session: SessionData) -> SessionData:
-        session_key = self._get_session_key(session.id)
+        session_id = str(session.id)
+        session_key = self._get_session_key(session_id)
         user_sessions_key = self._get_user_sessions_key(session.user_id)
 
         now = datetime.now(UTC)
@@ -58,7 +60,7 @@ class RedisSessionRepository(ISessionRepository):
             self._serialize_session(session)
         )
 
-        await self._redis.sadd(user_sessions_key, str(session.id))
+        await self._redis.sadd(user_sessions_key, session_id)
         await self._redis.expire(user_sessions_key, ttl + 3600)
 
         return session
@@ -77,25 +79,32 @@ class RedisSessionRepository(ISessionRepository):
         if not session_ids:
             return []
 
+        session_ids = [sid.decode('ascii') for sid in session_ids]
+        payloads = await self._redis.mget(
+            [self._get_session_key(sid) for sid in session_ids]
+        )
+
         sessions = []
-        for session_id_str in session_ids:
+        stale_ids = []
+        for session_id_str, data in zip(session_ids, payloads, strict=True):
+            if not data:
+                stale_ids.append(session_id_str)
+                continue
             try:
-                session = await self.get_by_id(UUID(session_id_str))
-                if session:
-                    sessions.append(session)
-                else:
-                    await self._redis.srem(user_sessions_key, session_id_str)
+                sessions.append(self._deserialize_session(data))
             except (ValueError, KeyError):
-                await self._redis.srem(user_sessions_key, session_id_str)
+                stale_ids.append(session_id_str)
+
+        if stale_ids:
+            await self._redis.srem(user_sessions_key, *stale_ids)
 
         return sessions
 
     async def update(self, session: SessionData) -> SessionData:
-        existing_session = await self.get_by_id(session.id)
-        if not existing_session:
+        session_key = self._get_session_key(session.id)
+        if not await self._redis.exists(session_key):
             raise ValueError(f'Session {session.id} not found')
 
-        session_key = self._get_session_key(session.id)
         now = datetime.now(UTC)
         ttl = int((session.expires_at - now).total_seconds())
 
@@ -111,25 +120,38 @@ class RedisSessionRepository(ISessionRepository):
         return session
 
     async def delete(self, session_id: UUID) -> None:
-        session = await self.get_by_id(session_id)
+        session_id_str = str(session_id)
+        session_key = self._get_session_key(session_id_str)
+        data = await self._redis.get(session_key)
 
-        await self._redis.delete(self._get_session_key(session_id))
+        await self._redis.delete(session_key)
 
-        if session:
+        if data:
+            session = self._deserialize_session(data)
             await self._redis.srem(
                 self._get_user_sessions_key(session.user_id),
-                str(session_id)
+                session_id_str
             )
 
+    async def _delete_keys(self, keys: list[str]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.delete(*keys)
+        await pipe.execute()
+
     async def delete_by_user_id(self, user_id: UUID) -> None:
         user_sessions_key = self._get_user_sessions_key(user_id)
-        session_ids = await self._redis.smembers(user_sessions_key)
+        session_keys: list[str] = []
+
+        async for sid in self._redis.sscan_iter(user_sessions_key, count=self._batch_size):
+            session_keys.append(self._get_session_key(sid.decode('ascii')))
+            if len(session_keys) >= self._batch_size:
+                await self._delete_keys(session_keys)
+                session_keys = []
 
-        if session_ids:
-            session_keys = [self._get_session_key(UUID(sid)) for sid in session_ids]
-            await self._redis.delete(*session_keys)
+        if session_keys:
+            await self._delete_keys(session_keys)
 
-            await self._redis.delete(user_sessions_key)
+        await self._redis.delete(user_sessions_key)
 
     async def delete_expired(self) -> int:
         deleted_count = 0
@@ -140,18 +162,38 @@ class RedisSessionRepository(ISessionRepository):
         while True:
             cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
 
-            for user_sessions_key in keys:
-                session_ids = await self._redis.smembers(user_sessions_key)
-
-                for session_id_str in session_ids:
-                    try:
-                        session_id = UUID(session_id_str)
-                        if not await self._redis.exists(self._get_session_key(session_id)):
-                            await self._redis.srem(user_sessions_key, session_id_str)
-                            deleted_count += 1
-                    except ValueError:
-                        await self._redis.srem(user_sessions_key, session_id_str)
-                        deleted_count += 1
+            if keys:
+                pipe = self._redis.pipeline(transaction=False)
+                for user_sessions_key in keys:
+                    pipe.smembers(user_sessions_key)
+                members_per_key = await pipe.execute()
+
+                stale: dict[bytes, list[bytes]] = {}
+                candidates: list[tuple[bytes, bytes]] = []
+                pipe = self._redis.pipeline(transaction=False)
+                for user_sessions_key, session_ids in zip(keys, members_per_key, strict=True):
+                    for sid in session_ids:
+                        try:
+                            session_id_str = sid.decode('ascii')
+                            UUID(session_id_str)
+                        except ValueError:
+                            stale.setdefault(user_sessions_key, []).append(sid)
+                            continue
+                        candidates.append((user_sessions_key, sid))
+                        pipe.exists(self._get_session_key(session_id_str))
+
+                if candidates:
+                    exists_flags = await pipe.execute()
+                    for (user_sessions_key, sid), exists in zip(candidates, exists_flags, strict=True):
+                        if not exists:
+                            stale.setdefault(user_sessions_key, []).append(sid)
+
+                if stale:
+                    pipe = self._redis.pipeline(transaction=False)
+                    for user_sessions_key, sids in stale.items():
+                        pipe.srem(user_sessions_key, *sids)
+                        deleted_count += len(sids)
+                    await pipe.execute()
 
             if cursor == 0:
                 break
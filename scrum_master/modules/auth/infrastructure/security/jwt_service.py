@@ -1,3 +1,6 @@
+import base64
+import json
+import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
@@ -78,7 +81,22 @@ class JWTService:
             expires_in=self.access_token_expire_minutes * 60,
         )
 
+    @staticmethod
+    def _is_expired(token: str) -> bool:
+        try:
+            payload_segment = token.split('.')[1]
+            payload = json.loads(
+                base64.urlsafe_b64decode(payload_segment + '=' * (-len(payload_segment) % 4))
+            )
+            return int(payload['exp']) < int(time.time())
+        except (IndexError, KeyError, OverflowError, TypeError, ValueError):
+            # Unreadable or odd payload (e.g. exp=Infinity): let jwt.decode reject it
+            return False
+
     def verify_access_token(self, token: str) -> AccessTokenPayload:
+        if self._is_expired(token):
+            raise ValueError('Invalid access token: Signature has expired')
+
         try:
             payload = jwt.decode(
                 token,
@@ -1,3 +1,4 @@
+import httpx
 from dishka import Provider, Scope, provide
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -50,19 +51,29 @@ class AuthModuleProvider(Provider):
         return SQLAlchemyOAuthConnectionRepository(session)
 
     @provide(scope=Scope.APP)
-    def get_github_oauth_provider(self, config: AuthModuleConfig) -> GithubOauthProvider:
+    def get_github_oauth_provider(
+        self,
+        config: AuthModuleConfig,
+        http_client: httpx.AsyncClient,
+    ) -> GithubOauthProvider:
         return GithubOauthProvider(
             client_id=config.github.client_id,
             client_secret=config.github.client_secret,
             redirect_uri=config.github.redirect_uri,
+            http_client=http_client,
         )
 
     @provide(scope=Scope.APP)
-    def get_google_oauth_provider(self, config: AuthModuleConfig) -> GoogleOAuthProvider:
+    def get_google_oauth_provider(
+        self,
+        config: AuthModuleConfig,
+        http_client: httpx.AsyncClient,
+    ) -> GoogleOAuthProvider:
         return GoogleOAuthProvider(
             client_id=config.google.client_id,
             client_secret=config.google.client_secret,
             redirect_uri=config.google.redirect_uri,
+            http_client=http_client,
         )
 
     @provide(scope=Scope.APP)
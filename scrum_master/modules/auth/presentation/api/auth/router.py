@@ -28,7 +28,7 @@ from scrum_master.modules.auth.infrastructure.security.jwt_service import \
     JWTService
 from scrum_master.modules.auth.presentation.api.auth.schemas import \
     UserResponse
-from scrum_master.shared.config import get_settings
+from scrum_master.shared.config import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,7 @@ async def google_callback(
     code: str,
     request: Request,
     interactor: FromDishka[GoogleOAuthLoginInteractor],
+    settings: FromDishka[Settings],
 ) -> RedirectResponse:
     try:
         dto = OAuthCallbackDTO(
@@ -69,7 +70,6 @@ async def google_callback(
             'expires_in': str(login_result.expires_in),
         }
         logger.info(f'Google OAuth callback redirect: {redirect_params}')
-        settings = get_settings()
         redirect_url = f'{settings.frontend_url}/auth/callback?{urlencode(redirect_params)}'
 
         redirect_response = RedirectResponse(
@@ -169,8 +169,16 @@ async def get_me(
     interactor: FromDishka[GetUserInteractor],
 ) -> UserResponse:
     try:
-        response_interactor = await interactor(user_access_token=credentials.credentials)
-        return UserResponse.model_validate(response_interactor)
+        user = await interactor(user_access_token=credentials.credentials)
+        return UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            role=user.role,
+            avatar_url=user.avatar_url,
+            created_at=user.created_at,
+            last_login_at=user.last_login_at,
+        )
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
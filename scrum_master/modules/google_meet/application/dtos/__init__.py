@@ -2,7 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-from scrum_master.modules.google_meet.domain.entities import MeetingStatus
+from scrum_master.modules.google_meet.domain.entities import (Meeting,
+                                                              MeetingStatus)
 
 
 @dataclass(slots=True)
@@ -29,6 +30,27 @@ class MeetingResponse:
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_entity(cls, meeting: Meeting) -> 'MeetingResponse':
+        return cls(
+            meeting.id,
+            meeting.user_id,
+            meeting.meet_url,
+            meeting.status,
+            meeting.bot_name,
+            meeting.error_message,
+            meeting.connected_at,
+            meeting.disconnected_at,
+            meeting.created_at,
+            meeting.updated_at,
+        )
+
+
+@dataclass(slots=True)
+class MeetingsPage:
+    items: list[MeetingResponse]
+    next_cursor: tuple[datetime, UUID] | None = None
+
 
 @dataclass(slots=True)
 class DisconnectFromMeetingRequest:
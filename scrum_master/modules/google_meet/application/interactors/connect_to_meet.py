@@ -1,6 +1,8 @@
 import asyncio
 import logging
+import uuid
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from scrum_master.modules.google_meet.application.dtos import (
     ConnectToMeetingRequest, MeetingResponse)
@@ -16,10 +18,11 @@ class ConnectToMeetInteractor:
         self,
         meeting_repository: IMeetingRepository,
         google_meet_adapter: IGoogleMeetAdapter,
+        executor: ThreadPoolExecutor,
     ):
         self.meeting_repository = meeting_repository
         self.google_meet_adapter = google_meet_adapter
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = executor
 
     def _connect_sync(
         self,
@@ -44,9 +47,10 @@ class ConnectToMeetInteractor:
         try:
             logger.info(f'Starting bot for meeting: {request.meet_url}')
 
-            # Start bot in background thread (non-blocking)
-            loop = asyncio.get_event_loop()
-            loop.run_in_executor(
+            # Spawning the bot process blocks (pickling, interpreter start), keep it off the loop.
+            # Awaited so a full supervisor surfaces here instead of being lost in the executor
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
                 self.executor,
                 self._connect_sync,
                 request.meet_url,
@@ -58,12 +62,11 @@ class ConnectToMeetInteractor:
             )
 
             # Return success immediately (bot runs in background)
-            import uuid
-            from datetime import datetime, timezone
-
             meeting_id = str(uuid.uuid4())
             logger.info(f'Bot started successfully for meeting: {meeting_id}')
 
+            now = datetime.now(timezone.utc)
+
             return MeetingResponse(
                 id=meeting_id,
                 user_id=request.user_id,
@@ -71,10 +74,10 @@ class ConnectToMeetInteractor:
                 status=MeetingStatus.CONNECTED,
                 bot_name=request.bot_name or "Google Bot",
                 error_message=None,
-                connected_at=datetime.now(timezone.utc),
+                connected_at=now,
                 disconnected_at=None,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
 
         except Exception as e:
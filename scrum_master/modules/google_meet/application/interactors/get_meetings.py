@@ -1,29 +1,39 @@
+from datetime import datetime
 from uuid import UUID
 
-from scrum_master.modules.google_meet.application.dtos import MeetingResponse
+from scrum_master.modules.google_meet.application.dtos import (MeetingResponse,
+                                                               MeetingsPage)
 from scrum_master.modules.google_meet.application.interfaces import \
     IMeetingRepository
+from scrum_master.modules.google_meet.domain.entities import MeetingStatus
 
 
 class GetMeetingsInteractor:
     def __init__(self, meeting_repository: IMeetingRepository):
         self.meeting_repository = meeting_repository
 
-    async def execute(self, user_id: UUID) -> list[MeetingResponse]:
-        meetings = await self.meeting_repository.get_by_user_id(user_id)
+    async def execute(
+        self,
+        user_id: UUID,
+        limit: int = 50,
+        after: tuple[datetime, UUID] | None = None,
+        status: MeetingStatus | None = None,
+    ) -> MeetingsPage:
+        # Fetch one extra row to know whether another page exists
+        meetings = await self.meeting_repository.get_by_user_id(
+            user_id,
+            limit=limit + 1,
+            after=after,
+            status=status,
+        )
 
-        return [
-            MeetingResponse(
-                id=meeting.id,
-                user_id=meeting.user_id,
-                meet_url=meeting.meet_url,
-                status=meeting.status,
-                bot_name=meeting.bot_name,
-                error_message=meeting.error_message,
-                connected_at=meeting.connected_at,
-                disconnected_at=meeting.disconnected_at,
-                created_at=meeting.created_at,
-                updated_at=meeting.updated_at,
-            )
-            for meeting in meetings
-        ]
+        next_cursor = None
+        if len(meetings) > limit:
+            meetings = meetings[:limit]
+            last = meetings[-1]
+            next_cursor = (last.created_at, last.id)
+
+        return MeetingsPage(
+            items=list(map(MeetingResponse.from_entity, meetings)),
+            next_cursor=next_cursor,
+        )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from scrum_master.modules.google_meet.domain.entities import (Meeting,
@@ -12,6 +13,7 @@ class IMeetingRepository(ABC):
         user_id: UUID,
         meet_url: str,
         bot_name: str | None = None,
+        initial_status: MeetingStatus = MeetingStatus.PENDING,
     ) -> Meeting:
         pass
 
@@ -20,7 +22,14 @@ class IMeetingRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_user_id(self, user_id: UUID) -> list[Meeting]:
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        *,
+        limit: int = 50,
+        after: tuple[datetime, UUID] | None = None,
+        status: MeetingStatus | None = None,
+    ) -> list[Meeting]:
         pass
 
     @abstractmethod
@@ -32,6 +41,16 @@ class IMeetingRepository(ABC):
     ) -> Meeting | None:
         pass
 
+    @abstractmethod
+    async def update_status_if(
+        self,
+        meeting_id: UUID,
+        user_id: UUID,
+        expected_status: MeetingStatus,
+        new_status: MeetingStatus,
+    ) -> Meeting | None:
+        pass
+
     @abstractmethod
     async def delete(self, meeting_id: UUID) -> bool:
         pass
@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 ENV_FILE = Path(__file__).parent.parent.parent.parent / '.env'
@@ -14,12 +15,23 @@ class GoogleMeetConfig(BaseSettings):
         extra='ignore',
     )
 
-    chromedriver_path: str = os.getenv('CHROMEDRIVER_PATH', '/usr/local/bin/chromedriver')
-    chrome_bin: Optional[str] = os.getenv('CHROME_BIN')
+    chromedriver_path: str = Field(
+        '/usr/local/bin/chromedriver',
+        validation_alias=AliasChoices('GOOGLE_MEET_CHROMEDRIVER_PATH', 'CHROMEDRIVER_PATH'),
+    )
+    chrome_bin: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices('GOOGLE_MEET_CHROME_BIN', 'CHROME_BIN'),
+    )
     headless: bool = True
     enable_logging: bool = True
     bot_name: str = 'Scrum Bot'
     auto_join: bool = True
+    max_workers: int = min(32, (os.cpu_count() or 4) * 5)
+    max_concurrent_bots: int = Field(
+        8,
+        validation_alias=AliasChoices('GOOGLE_MEET_MAX_CONCURRENT_BOTS', 'MAX_CONCURRENT_BOTS'),
+    )
 
     # Bot-specific settings
     min_record_time: int = 3600  # 1 hour in seconds
@@ -31,5 +43,15 @@ class GoogleMeetConfig(BaseSettings):
     presigned_url_audio: Optional[str] = None
 
 
+_google_meet_config: GoogleMeetConfig | None = None
+
+
+def get_google_meet_config() -> GoogleMeetConfig:
+    global _google_meet_config
+    if _google_meet_config is None:
+        _google_meet_config = GoogleMeetConfig()
+    return _google_meet_config
+
+
 class GoogleMeetModuleConfig(BaseSettings):
-    google_meet: GoogleMeetConfig = GoogleMeetConfig()
+    google_meet: GoogleMeetConfig = Field(default_factory=get_google_meet_config)
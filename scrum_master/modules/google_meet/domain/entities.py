@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum as PyEnum
+from typing import Any, ClassVar
 from uuid import UUID, uuid4
 
 from sqlalchemy import DateTime
 from sqlalchemy import Enum as SqlEnum
-from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy import ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from scrum_master.modules.auth.domain.entities import Base
@@ -60,6 +61,11 @@ class Meeting(Base):
         nullable=False,
     )
 
+    __table_args__ = (
+        Index('ix_meetings_user_created_id', 'user_id', 'created_at', 'id'),
+    )
+    __mapper_args__: ClassVar[dict[str, Any]] = {'eager_defaults': True}
+
     def update_status(self, status: MeetingStatus, error_message: str | None = None) -> None:
         self.status = status
         if error_message:
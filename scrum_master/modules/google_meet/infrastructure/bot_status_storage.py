@@ -1,7 +1,9 @@
 """In-memory storage for bot statuses with thread-safe operations."""
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Optional
 
@@ -19,26 +21,36 @@ class BotStatus(str, Enum):
     ERROR = 'error'
 
 
+FINAL_STATUSES = frozenset({BotStatus.DONE, BotStatus.ERROR})
+
+
+@dataclass(slots=True)
 class BotStatusInfo:
     """Information about bot status."""
 
-    def __init__(self, bot_id: str, status: BotStatus, user_id: str):
-        self.bot_id = bot_id
-        self.status = status
-        self.user_id = user_id
-        self.created_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
-        self.error_message: Optional[str] = None
-        self.session_id: Optional[str] = None
-        self.result_data: Optional[dict] = None
+    bot_id: str
+    status: BotStatus
+    user_id: str
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(init=False)
+    error_message: Optional[str] = None
+    session_id: Optional[str] = None
+    result_data: Optional[dict] = None
+
+    def __post_init__(self):
+        self.updated_at = self.created_at
 
     def update_status(self, status: BotStatus, error_message: Optional[str] = None):
         """Update status and timestamp."""
         self.status = status
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
         if error_message:
             self.error_message = error_message
 
+    def etag(self) -> str:
+        """Weak ETag that changes whenever the status info is updated."""
+        return f'W/"{self.bot_id}-{self.updated_at.timestamp()}"'
+
     def to_dict(self) -> dict:
         """Convert to dictionary for API response."""
         return {
@@ -58,7 +70,11 @@ class BotStatusStorage:
 
     def __init__(self):
         self._storage: dict[str, BotStatusInfo] = {}
+        # Min-heap of (updated_at, bot_id); entries superseded by a later update are skipped
+        self._by_time: list[tuple[datetime, str]] = []
         self._lock = asyncio.Lock()
+        # Set while at least one bot may need status sync
+        self._has_active = asyncio.Event()
         self._cleanup_task: Optional[asyncio.Task] = None
 
     async def start_cleanup_task(self):
@@ -82,16 +98,15 @@ class BotStatusStorage:
         while True:
             try:
                 await asyncio.sleep(3600)  # Run every hour
-                cutoff_time = datetime.utcnow() - timedelta(hours=24)
+                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
 
                 async with self._lock:
-                    old_keys = [
-                        bot_id for bot_id, info in self._storage.items()
-                        if info.updated_at < cutoff_time
-                    ]
-                    for bot_id in old_keys:
-                        del self._storage[bot_id]
-                        logger.info(f'Cleaned up old bot status: {bot_id}')
+                    while self._by_time and self._by_time[0][0] < cutoff_time:
+                        updated_at, bot_id = heapq.heappop(self._by_time)
+                        info = self._storage.get(bot_id)
+                        if info and info.updated_at == updated_at:
+                            del self._storage[bot_id]
+                            logger.info(f'Cleaned up old bot status: {bot_id}')
 
             except asyncio.CancelledError:
                 break
@@ -103,6 +118,9 @@ class BotStatusStorage:
         async with self._lock:
             info = BotStatusInfo(bot_id, status, user_id)
             self._storage[bot_id] = info
+            heapq.heappush(self._by_time, (info.updated_at, bot_id))
+            if status not in FINAL_STATUSES:
+                self._has_active.set()
             logger.info(f'Created bot status: {bot_id} with status {status.value}')
             return info
 
@@ -111,6 +129,21 @@ class BotStatusStorage:
         async with self._lock:
             return self._storage.get(bot_id)
 
+    async def list_active(self) -> list[BotStatusInfo]:
+        """Get bots that are not in a final status."""
+        async with self._lock:
+            active = [
+                info for info in self._storage.values()
+                if info.status not in FINAL_STATUSES
+            ]
+            if not active:
+                self._has_active.clear()
+            return active
+
+    async def wait_for_active(self):
+        """Wait until there is at least one bot in a non-final status."""
+        await self._has_active.wait()
+
     async def update_status(
         self,
         bot_id: str,
@@ -124,6 +157,9 @@ class BotStatusStorage:
             info = self._storage.get(bot_id)
             if info:
                 info.update_status(status, error_message)
+                heapq.heappush(self._by_time, (info.updated_at, bot_id))
+                if status not in FINAL_STATUSES:
+                    self._has_active.set()
                 if session_id:
                     info.session_id = session_id
                 if result_data:
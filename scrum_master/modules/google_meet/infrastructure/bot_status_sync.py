@@ -7,31 +7,70 @@ import httpx
 
 from scrum_master.modules.google_meet.infrastructure.bot_status_storage import (
     BotStatus,
+    BotStatusInfo,
     BotStatusStorage,
 )
 
 logger = logging.getLogger(__name__)
 
+# Статусы, которые синхронизируются из внешнего сервиса
+_SYNCABLE_STATUSES = frozenset({BotStatus.STARTING, BotStatus.RUNNING})
+
+# Внешний статус бота -> наш статус
+_EXTERNAL_STATUS_MAP: dict[str, BotStatus] = {
+    'initialized': BotStatus.STARTING,
+    'connecting': BotStatus.STARTING,
+    'starting': BotStatus.STARTING,
+    'connected': BotStatus.RUNNING,
+    'running': BotStatus.RUNNING,
+}
+
+# Ответы, означающие что у сервиса нет батч-эндпоинта
+_BATCH_UNSUPPORTED_CODES = frozenset({404, 405, 501})
+
 
 class BotStatusSyncTask:
     """Background task to sync bot statuses from external bot service."""
 
-    def __init__(self, storage: BotStatusStorage, sync_interval: int = 3):
+    def __init__(
+        self,
+        storage: BotStatusStorage,
+        sync_interval: int = 3,
+        max_concurrency: int = 32,
+        base_url: str = 'http://host.docker.internal:8001',
+    ):
         """
         Initialize sync task.
 
         Args:
             storage: Bot status storage instance
             sync_interval: Interval in seconds between syncs (default: 3)
+            max_concurrency: Max parallel requests to bot service (default: 32)
+            base_url: Base URL of the external bot service
         """
         self.storage = storage
         self.sync_interval = sync_interval
+        self.max_concurrency = max_concurrency
+        self.base_url = base_url
+        self._client: Optional[httpx.AsyncClient] = None
+        # None - ещё не знаем, есть ли у сервиса батч-эндпоинт
+        self._batch_supported: Optional[bool] = None
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
     async def start(self):
         """Start the background sync task."""
         if self._task is None or self._task.done():
+            # Один клиент на всё время жизни задачи, чтобы держать keep-alive
+            if self._client is None:
+                self._client = httpx.AsyncClient(
+                    base_url=self.base_url,
+                    timeout=10.0,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency,
+                    ),
+                )
             self._running = True
             self._task = asyncio.create_task(self._sync_loop())
             logger.info('Bot status sync task started')
@@ -46,11 +85,16 @@ class BotStatusSyncTask:
             except asyncio.CancelledError:
                 pass
             logger.info('Bot status sync task stopped')
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _sync_loop(self):
         """Main sync loop."""
         while self._running:
             try:
+                # Спим без таймера, пока нет активных ботов
+                await self.storage.wait_for_active()
                 await asyncio.sleep(self.sync_interval)
                 await self._sync_statuses()
             except asyncio.CancelledError:
@@ -60,64 +104,107 @@ class BotStatusSyncTask:
 
     async def _sync_statuses(self):
         """Sync statuses from external service for active bots."""
-        # Получаем все боты из storage
-        async with self.storage._lock:
-            bot_ids = list(self.storage._storage.keys())
-
-        if not bot_ids:
+        # Один снимок активных ботов под локом;
+        # опрашиваем только те, что ещё подключаются к встрече
+        syncable = [
+            bot_info for bot_info in await self.storage.list_active()
+            if bot_info.status in _SYNCABLE_STATUSES
+        ]
+
+        if not syncable:
             return
 
-        # Обновляем статусы для ботов, которые еще не в финальном состоянии
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for bot_id in bot_ids:
-                try:
-                    bot_info = await self.storage.get(bot_id)
-                    if not bot_info:
-                        continue
-
-                    # Пропускаем боты в финальных состояниях
-                    if bot_info.status in [BotStatus.DONE, BotStatus.ERROR]:
-                        continue
-
-                    # Получаем статус из внешнего сервиса
-                    # только для первых трех статусов
-                    if bot_info.status in [
-                        BotStatus.INITIALIZED,
-                        BotStatus.CONNECTING,
-                        BotStatus.CONNECTED,
-                    ]:
-                        response = await client.get(
-                            f'http://host.docker.internal:8001/api/v1/bots/{bot_id}'
-                        )
-                        response.raise_for_status()
-                        external_data = response.json()
-
-                        # Маппим внешний статус на наш
-                        external_status = external_data.get('status', '')
-                        new_status = None
-
-                        if external_status == 'initialized':
-                            new_status = BotStatus.INITIALIZED
-                        elif external_status == 'connecting':
-                            new_status = BotStatus.CONNECTING
-                        elif external_status == 'connected':
-                            new_status = BotStatus.CONNECTED
-
-                        # Обновляем статус если он изменился
-                        if new_status and new_status != bot_info.status:
-                            await self.storage.update_status(bot_id, new_status)
-                            logger.info(
-                                f'Synced bot {bot_id} status: '
-                                f'{bot_info.status.value} -> {new_status.value}'
-                            )
-
-                except httpx.HTTPError as e:
-                    logger.warning(f'Failed to sync status for bot {bot_id}: {e}')
-                except Exception as e:
-                    logger.error(
-                        f'Unexpected error syncing bot {bot_id}: {e}',
-                        exc_info=True
-                    )
+        # Один батч-запрос вместо N, если внешний сервис его поддерживает
+        if self._batch_supported is not False:
+            try:
+                statuses = await self._fetch_statuses_batch(syncable)
+            except httpx.HTTPError as e:
+                # Батч не удался - в этот раз опрашиваем ботов по одному
+                logger.warning(f'Failed to batch sync bot statuses, polling per bot: {e}')
+                statuses = None
+            if statuses is not None:
+                for bot_info in syncable:
+                    external_data = statuses.get(bot_info.bot_id)
+                    if isinstance(external_data, dict):
+                        await self._apply_status(bot_info, external_data.get('status', ''))
+                return
+
+        # Опрашиваем внешний сервис параллельно, ограничивая число запросов
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(
+            *(self._sync_bot(self._client, semaphore, bot_info) for bot_info in syncable)
+        )
+
+    async def _fetch_statuses_batch(
+        self,
+        bots: list[BotStatusInfo],
+    ) -> Optional[dict[str, dict]]:
+        """Fetch statuses of several bots in one request, None if unsupported."""
+        response = await self._client.post(
+            '/api/v1/bots/status',
+            json={'ids': [bot_info.bot_id for bot_info in bots]},
+        )
+        # Первая проба: любой 4xx значит, что сервис не знает батч-эндпоинт
+        first_probe = self._batch_supported is None
+        if response.status_code in _BATCH_UNSUPPORTED_CODES or (
+            first_probe and 400 <= response.status_code < 500
+        ):
+            # Старый сервис без батч-эндпоинта - больше не пробуем
+            self._batch_supported = False
+            logger.info(
+                f'Bot service has no batch status endpoint '
+                f'({response.status_code}), polling per bot'
+            )
+            return None
+        response.raise_for_status()
+
+        statuses = response.json()
+        if not isinstance(statuses, dict):
+            logger.warning(f'Unexpected batch status response: {type(statuses).__name__}')
+            if first_probe:
+                self._batch_supported = False
+            return None
+
+        self._batch_supported = True
+        return statuses
+
+    async def _sync_bot(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        bot_info: BotStatusInfo,
+    ):
+        """Sync status of a single bot."""
+        bot_id = bot_info.bot_id
+        try:
+            # Получаем статус из внешнего сервиса
+            async with semaphore:
+                response = await client.get(f'/api/v1/bots/{bot_id}')
+            response.raise_for_status()
+            external_data = response.json()
+
+            await self._apply_status(bot_info, external_data.get('status', ''))
+
+        except httpx.HTTPError as e:
+            logger.warning(f'Failed to sync status for bot {bot_id}: {e}')
+        except Exception as e:
+            logger.error(
+                f'Unexpected error syncing bot {bot_id}: {e}',
+                exc_info=True
+            )
+
+    async def _apply_status(self, bot_info: BotStatusInfo, external_status: str):
+        """Store the mapped external status if it changed."""
+        # Маппим внешний статус на наш
+        new_status = _EXTERNAL_STATUS_MAP.get(external_status)
+
+        # Обновляем статус если он изменился
+        if new_status and new_status != bot_info.status:
+            await self.storage.update_status(bot_info.bot_id, new_status)
+            logger.info(
+                f'Synced bot {bot_info.bot_id} status: '
+                f'{bot_info.status.value} -> {new_status.value}'
+            )
 
 
 # Global instance
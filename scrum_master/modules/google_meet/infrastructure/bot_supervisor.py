@@ -0,0 +1,54 @@
+"""Supervisor for long-running Selenium bot processes."""
+import logging
+import multiprocessing
+import threading
+from collections.abc import Callable
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BotCapacityExceededError(Exception):
+    """Raised when every bot slot is busy."""
+    pass
+
+
+class BotSupervisor:
+    """Runs each bot in its own process, capped at max_bots at a time."""
+
+    def __init__(self, max_bots: int):
+        self.max_bots = max_bots
+        self._slots = threading.BoundedSemaphore(max_bots)
+        # spawn: a fresh interpreter, no inherited event loop or locks
+        self._context = multiprocessing.get_context('spawn')
+
+    def new_event(self) -> Event:
+        """Create an event that can be shared with a bot process."""
+        return self._context.Event()
+
+    def spawn(self, target: Callable[..., Any], *args: Any) -> BaseProcess:
+        """Start target in a new process or fail fast if no slot is free."""
+        if not self._slots.acquire(blocking=False):
+            raise BotCapacityExceededError(
+                f'All {self.max_bots} bot slots are busy, retry later'
+            )
+
+        process = self._context.Process(target=target, args=args, daemon=True)
+        try:
+            process.start()
+        except Exception:
+            self._slots.release()
+            raise
+
+        threading.Thread(target=self._reap, args=(process,), daemon=True).start()
+        return process
+
+    def _reap(self, process: BaseProcess) -> None:
+        try:
+            process.join()
+            if process.exitcode:
+                logger.error(f'Bot process {process.pid} exited with code {process.exitcode}')
+        finally:
+            self._slots.release()
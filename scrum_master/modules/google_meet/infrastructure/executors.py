@@ -0,0 +1,17 @@
+"""Shared thread pool for blocking Google Meet bot operations."""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Global instance
+_meet_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_meet_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get global executor for blocking Selenium calls."""
+    global _meet_executor
+    if _meet_executor is None:
+        _meet_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='meet-bot',
+        )
+    return _meet_executor
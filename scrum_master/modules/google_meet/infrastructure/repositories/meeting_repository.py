@@ -1,6 +1,7 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from scrum_master.modules.google_meet.domain.entities import (Meeting,
@@ -16,29 +17,41 @@ class MeetingRepository:
         user_id: UUID,
         meet_url: str,
         bot_name: str | None = None,
+        initial_status: MeetingStatus = MeetingStatus.PENDING,
     ) -> Meeting:
         meeting = Meeting(
             user_id=user_id,
             meet_url=meet_url,
             bot_name=bot_name,
-            status=MeetingStatus.PENDING,
+            status=initial_status,
         )
         self.session.add(meeting)
+        # Server defaults come back via INSERT ... RETURNING (eager_defaults)
         await self.session.commit()
-        await self.session.refresh(meeting)
         return meeting
 
     async def get_by_id(self, meeting_id: UUID) -> Meeting | None:
-        result = await self.session.execute(
-            select(Meeting).where(Meeting.id == meeting_id)
-        )
-        return result.scalar_one_or_none()
+        # Served from the session identity map when already loaded
+        return await self.session.get(Meeting, meeting_id)
+
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        *,
+        limit: int = 50,
+        after: tuple[datetime, UUID] | None = None,
+        status: MeetingStatus | None = None,
+    ) -> list[Meeting]:
+        query = select(Meeting).where(Meeting.user_id == user_id)
+        if status is not None:
+            query = query.where(Meeting.status == status)
+        if after is not None:
+            query = query.where(tuple_(Meeting.created_at, Meeting.id) < tuple_(*after))
 
-    async def get_by_user_id(self, user_id: UUID) -> list[Meeting]:
         result = await self.session.execute(
-            select(Meeting)
-            .where(Meeting.user_id == user_id)
-            .order_by(Meeting.created_at.desc())
+            query
+            .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+            .limit(limit)
         )
         return list(result.scalars().all())
 
@@ -48,17 +61,53 @@ class MeetingRepository:
         status: MeetingStatus,
         error_message: str | None = None,
     ) -> Meeting | None:
-        meeting = await self.get_by_id(meeting_id)
-        if meeting:
-            meeting.update_status(status, error_message)
-            await self.session.commit()
-            await self.session.refresh(meeting)
+        return await self._update_returning(
+            Meeting.id == meeting_id,
+            values=_status_values(status, error_message),
+        )
+
+    async def update_status_if(
+        self,
+        meeting_id: UUID,
+        user_id: UUID,
+        expected_status: MeetingStatus,
+        new_status: MeetingStatus,
+    ) -> Meeting | None:
+        return await self._update_returning(
+            Meeting.id == meeting_id,
+            Meeting.user_id == user_id,
+            Meeting.status == expected_status,
+            values=_status_values(new_status),
+        )
+
+    async def _update_returning(self, *criteria, values: dict) -> Meeting | None:
+        result = await self.session.execute(
+            update(Meeting)
+            .where(*criteria)
+            .values(**values)
+            .returning(Meeting)
+        )
+        meeting = result.scalar_one_or_none()
+        await self.session.commit()
         return meeting
 
     async def delete(self, meeting_id: UUID) -> bool:
-        meeting = await self.get_by_id(meeting_id)
-        if meeting:
-            await self.session.delete(meeting)
-            await self.session.commit()
-            return True
-        return False
+        result = await self.session.execute(
+            delete(Meeting)
+            .where(Meeting.id == meeting_id)
+            .returning(Meeting.id)
+        )
+        deleted_id = result.scalar_one_or_none()
+        await self.session.commit()
+        return deleted_id is not None
+
+
+def _status_values(status: MeetingStatus, error_message: str | None = None) -> dict:
+    values = {'status': status, 'updated_at': func.now()}
+    if error_message:
+        values['error_message'] = error_message
+    if status == MeetingStatus.CONNECTED:
+        values['connected_at'] = func.now()
+    elif status in (MeetingStatus.DISCONNECTED, MeetingStatus.FAILED):
+        values['disconnected_at'] = func.now()
+    return values
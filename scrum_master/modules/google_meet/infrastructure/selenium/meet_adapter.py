@@ -1,13 +1,17 @@
 """Google Meet adapter - Simplified."""
 import logging
-import threading
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event
 from typing import Any
 
 from scrum_master.modules.google_meet.application.interfaces import \
     IGoogleMeetAdapter
 from scrum_master.modules.google_meet.config import GoogleMeetConfig
+from scrum_master.modules.google_meet.infrastructure.bot_supervisor import (
+    BotCapacityExceededError, BotSupervisor)
 
-from .meet_bot import GoogleMeetUIException, JoinGoogleMeet
+from .meet_bot import (GoogleMeetUIException, get_chromedriver_path,
+                       run_bot_process)
 
 
 class GoogleMeetAdapter(IGoogleMeetAdapter):
@@ -15,9 +19,10 @@ class GoogleMeetAdapter(IGoogleMeetAdapter):
 
     def __init__(self, config: GoogleMeetConfig):
         self.config = config
-        self.bot: JoinGoogleMeet | None = None
         self.logger = logging.getLogger(__name__)
-        self.bot_thread: threading.Thread | None = None
+        self.bot_process: BaseProcess | None = None
+        self.stop_event: Event | None = None
+        self.supervisor = BotSupervisor(config.max_concurrent_bots)
 
     def initialize_driver(self) -> None:
         """Initialize driver (no-op)."""
@@ -32,7 +37,7 @@ class GoogleMeetAdapter(IGoogleMeetAdapter):
         presigned_url_combined: str | None = None,
         presigned_url_audio: str | None = None,
     ) -> None:
-        """Connect to meeting in background thread."""
+        """Connect to meeting in a background process."""
         try:
             bot_display_name = bot_name or self.config.bot_name
             record_time = min_record_time or 3600
@@ -40,43 +45,41 @@ class GoogleMeetAdapter(IGoogleMeetAdapter):
 
             self.logger.info(f"Starting bot for: {meet_url}")
 
-            self.bot = JoinGoogleMeet(
-                meetlink=meet_url,
-                bot_name=bot_display_name,
-                min_record_time=record_time,
-                max_waiting_time=waiting_time,
-                presigned_url_combined=presigned_url_combined,
-                presigned_url_audio=presigned_url_audio,
-                logger=self.logger,
-            )
+            bot_kwargs = {
+                "meetlink": meet_url,
+                "bot_name": bot_display_name,
+                "min_record_time": record_time,
+                "max_waiting_time": waiting_time,
+                "presigned_url_combined": presigned_url_combined,
+                "presigned_url_audio": presigned_url_audio,
+                # Cached after the first bot; runs on the executor thread, not the event loop
+                "driver_path": get_chromedriver_path(self.config.chromedriver_path),
+            }
 
-            # Run bot in background thread
-            self.bot_thread = threading.Thread(target=self._run_bot, daemon=True)
-            self.bot_thread.start()
+            # Each bot gets its own process so a crashed Chrome can't take others down
+            stop_event = self.supervisor.new_event()
+            self.bot_process = self.supervisor.spawn(run_bot_process, bot_kwargs, stop_event)
+            self.stop_event = stop_event
 
             self.logger.info("Bot started in background")
 
+        except BotCapacityExceededError:
+            self.logger.warning("Bot capacity exceeded, rejecting meeting")
+            raise
         except Exception as e:
             self.logger.error(f"Failed to start bot: {e}", exc_info=True)
             raise GoogleMeetUIException(f"Connection error: {e}")
 
-    def _run_bot(self):
-        """Run bot in background."""
-        try:
-            if self.bot:
-                self.bot.run()
-        except Exception as e:
-            self.logger.error(f"Bot execution error: {e}", exc_info=True)
-
     def disconnect_from_meeting(self) -> None:
         """Disconnect from meeting."""
-        if self.bot:
+        if self.bot_process:
             try:
                 self.logger.info("Disconnecting...")
-                self.bot.end_session()
-                if self.bot_thread and self.bot_thread.is_alive():
-                    self.bot_thread.join(timeout=5)
-                self.bot = None
+                self.stop_event.set()
+                if self.bot_process.is_alive():
+                    self.bot_process.join(timeout=5)
+                self.bot_process = None
+                self.stop_event = None
             except Exception as e:
                 self.logger.error(f"Disconnect error: {e}")
 
@@ -3,14 +3,19 @@ import json
 import logging
 import os
 import platform
+import shutil
+import signal
 import subprocess
 import time
 import uuid
+from contextlib import suppress
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Event
+from threading import Event, Lock, Thread
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import (NoSuchElementException,
                                         TimeoutException, WebDriverException)
@@ -19,10 +24,60 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from urllib3.util.retry import Retry
 from webdriver_manager.chrome import ChromeDriverManager
 
 from .random_mouse import random_mouse_movements
-from .utils import audio_file_path, create_tar_archive, save_screenshot
+from .utils import create_tar_archive, save_screenshot
+
+
+# XPath locators, built once and reused by every bot and every admission check
+ADMITTED_XPATH = '//div[contains(@class, "u6vdEc")]'
+LOBBY_XPATH = '//*[contains(text(), "Asking to be let in")]'
+ADMITTED_OR_LOBBY_XPATH = f'{ADMITTED_XPATH} | {LOBBY_XPATH}'
+ADMITTED_EXPRESSION = """document.querySelector('div[class*="u6vdEc"]') !== null"""
+MIC_OFF_XPATH = '//*[(self::div or self::button) and @aria-label="Turn off microphone"]'
+CAMERA_OFF_XPATH = '//*[(self::div or self::button) and @aria-label="Turn off camera"]'
+NAME_INPUT_XPATH = "//input[@placeholder='Your name'] | //input[@type='text' and @aria-label]"
+JOIN_BUTTON_XPATH = '//button[contains(., "Ask to join") or contains(., "Join now")]'
+JOIN_BUTTON_JS = """
+return [...document.querySelectorAll('button')].find(
+    b => !b.disabled && /Join now|Ask to join|Join the call/.test(b.innerText)
+) || null;
+"""
+
+# Pre-join setup in a single script run: mic off, camera off.
+# The name is typed with send_keys: Meet may ignore a programmatic .value
+PREJOIN_JS = """
+const pick = sels => sels.map(s => document.querySelector(s)).find(Boolean);
+const mic = pick(['[aria-label="Turn off microphone"]', '[aria-label="Отключить микрофон"]']);
+if (mic) mic.click();
+const camera = pick(['[aria-label="Turn off camera"]', '[aria-label="Отключить камеру"]']);
+if (camera) camera.click();
+return {mic: !!mic, camera: !!camera};
+"""
+
+# Speech-tuned Opus: voip mode and medium complexity keep ffmpeg CPU low per bot
+OPUS_VOICE_ARGS = (
+    "-acodec", "libopus", "-application", "voip", "-compression_level", "5",
+    "-frame_duration", "60", "-vbr", "on", "-b:a", "64k", "-ac", "1", "-ar", "48000",
+)
+
+# Smooth over capture clock drift and gaps the same way on every platform
+RESAMPLE_ARGS = ("-af", "aresample=async=1000")
+
+# Below this Chrome is told to keep its shared memory in /tmp instead of /dev/shm
+MIN_DEV_SHM_BYTES = 1 << 30
+
+# Static assets the headless bot never looks at
+BLOCKED_RESOURCE_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp",
+    "*.mp4", "*.webm", "*.woff", "*.woff2", "*.ttf",
+]
+
+
+# Output directory for recordings, created once per process rather than per bot
+Path("out").mkdir(exist_ok=True)
 
 
 class GoogleMeetUIException(Exception):
@@ -30,6 +85,50 @@ class GoogleMeetUIException(Exception):
     pass
 
 
+_chromedriver_path: str | None = None
+_chromedriver_lock = Lock()
+
+
+def get_chromedriver_path(preferred: str | None = None) -> str:
+    """Resolve ChromeDriver once per process: preferred path, CHROMEDRIVER_PATH, then webdriver-manager."""
+    global _chromedriver_path
+    # May download a driver: call it from a worker thread, never from the event loop
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            env_path = os.getenv("CHROMEDRIVER_PATH")
+            if preferred and os.path.exists(preferred):
+                _chromedriver_path = preferred
+            elif env_path and os.path.exists(env_path):
+                _chromedriver_path = env_path
+            else:
+                _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+
+def dev_shm_is_large() -> bool:
+    """Check that /dev/shm is big enough for Chrome's shared memory."""
+    try:
+        stats = os.statvfs("/dev/shm")
+    except OSError:
+        return False
+    return stats.f_bavail * stats.f_frsize >= MIN_DEV_SHM_BYTES
+
+
+_upload_session: requests.Session | None = None
+
+
+def get_upload_session() -> requests.Session:
+    """Keep-alive session with transport retries for recording uploads."""
+    global _upload_session
+    if _upload_session is None:
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        _upload_session = requests.Session()
+        _upload_session.mount("https://", adapter)
+        _upload_session.mount("http://", adapter)
+    return _upload_session
+
+
 class JoinGoogleMeet:
     """Google Meet bot for joining meetings and recording audio."""
 
@@ -44,6 +143,7 @@ class JoinGoogleMeet:
         presigned_url_audio: str | None = None,
         max_waiting_time: int = 1800,
         logger: logging.Logger | None = None,
+        driver_path: str | None = None,
     ):
         """Initialize Google Meet bot."""
         self.meetlink = meetlink
@@ -52,10 +152,13 @@ class JoinGoogleMeet:
         self.min_record_time = min_record_time
         self.bot_name = bot_name
         self.browser = None
+        self._wait5: WebDriverWait | None = None
+        self._wait10: WebDriverWait | None = None
         self.recording_started = False
         self.recording_start_time = None
         self.stop_event = Event()
         self.recording_process = None
+        self._final_audio_path: Path | None = None
         self.presigned_url_combined = presigned_url_combined
         self.presigned_url_audio = presigned_url_audio
         self.id = str(uuid.uuid4())
@@ -66,13 +169,14 @@ class JoinGoogleMeet:
         self.max_waiting_time = max_waiting_time
         self.session_ended = False
         self.logger = logger or logging.getLogger(__name__)
-
-        # Create output directory
-        Path("out").mkdir(exist_ok=True)
+        self.driver_path = driver_path
+        self.profile_dir = f"/tmp/CueMeet{self.id}"
 
     def setup_browser(self) -> None:
         """Setup Chrome browser."""
         options = Options()
+        # Return from get() at DOMContentLoaded; join_meeting waits for the controls it needs
+        options.page_load_strategy = 'eager'
         options.add_argument('--headless=new')
         options.add_argument('--start-maximized')
         options.add_argument('--window-size=1920,1080')
@@ -83,14 +187,23 @@ class JoinGoogleMeet:
         options.add_argument("--disable-gpu")
         options.add_argument("--disable-application-cache")
         options.add_argument("--disable-setuid-sandbox")
-        options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--disable-blink-features=AutomationControlled')
+        # Renderer subsystems the bot never uses
+        options.add_argument('--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter')
         options.add_argument("--use-fake-ui-for-media-stream")
         options.add_argument("--use-fake-device-for-media-stream")
         options.add_argument('--disable-software-rasterizer')
         options.add_argument('--disable-web-security')
         options.add_argument('--allow-running-insecure-content')
-        options.add_argument(f"user-data-dir=/tmp/CueMeet{self.id}")
+        options.add_argument(f"user-data-dir={self.profile_dir}")
+        # The bot only needs the DOM and audio, never pixels
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        if dev_shm_is_large():
+            self.logger.info("Chrome shared memory: /dev/shm")
+        else:
+            # Docker's default 64 MB /dev/shm crashes renderers; fall back to /tmp
+            options.add_argument('--disable-dev-shm-usage')
+            self.logger.info("Chrome shared memory: /tmp (/dev/shm too small)")
 
         options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option('useAutomationExtension', False)
@@ -99,20 +212,25 @@ class JoinGoogleMeet:
             "profile.default_content_setting_values.media_stream_camera": 0,
             "profile.default_content_setting_values.geolocation": 0,
             "profile.default_content_setting_values.notifications": 0,
+            "profile.managed_default_content_settings.images": 2,
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
         })
 
         try:
-            self.logger.info("Installing ChromeDriver...")
             self.browser = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(self.driver_path or get_chromedriver_path()),
                 options=options
             )
-            self.browser.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36'
+            # User agent comes from the CLI flag; the stealth patch must run before page scripts
+            self.browser.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             })
-            self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            self.browser.execute_cdp_cmd('Network.enable', {})
+            self.browser.execute_cdp_cmd('Network.setBlockedURLs', {"urls": BLOCKED_RESOURCE_URLS})
+            # One wait object per timeout, shared by every join stage; poll at 100ms, not 500ms
+            self._wait5 = WebDriverWait(self.browser, 5, poll_frequency=0.1)
+            self._wait10 = WebDriverWait(self.browser, 10, poll_frequency=0.1)
             self.logger.info("Browser launched successfully")
         except Exception as e:
             self.logger.error(f"Failed to launch browser: {e}", exc_info=True)
@@ -120,27 +238,12 @@ class JoinGoogleMeet:
 
     def navigate_to_meeting(self) -> None:
         """Navigate to Google Meet."""
-        if not hasattr(self, '_visited_homepage'):
-            self.logger.info("Visiting Google Meet homepage...")
-            try:
-                self.browser.get("https://meet.google.com/")
-                time.sleep(2)
-                self.browser.execute_script("""
-                    localStorage.setItem('meet_visited', 'true');
-                    localStorage.setItem('meet_prefs_set', 'true');
-                """)
-                self._visited_homepage = True
-            except Exception as e:
-                self.logger.warning(f"Failed to visit homepage: {e}")
-
         self.logger.info(f"Navigating to: {self.meetlink}")
 
         for attempt in range(3):
             try:
+                # get() blocks until DOMContentLoaded (pageLoadStrategy "eager"), enough for the URL check
                 self.browser.get(self.meetlink)
-                WebDriverWait(self.browser, 15).until(
-                    lambda d: d.execute_script("return document.readyState") == "complete"
-                )
 
                 current_url = self.browser.current_url
                 self.logger.info(f"Current URL: {current_url}")
@@ -153,7 +256,7 @@ class JoinGoogleMeet:
 
                 self.logger.info("Navigation successful")
                 break
-            except Exception as e:
+            except WebDriverException as e:
                 self.logger.error(f"Navigation error: {e}")
                 if attempt < 2:
                     time.sleep(3)
@@ -166,108 +269,98 @@ class JoinGoogleMeet:
     def join_meeting(self) -> None:
         """Join the meeting."""
         self.logger.info("Joining meeting...")
-        time.sleep(3)
 
-        # Disable mic
+        # The mic button showing up means the pre-join screen is ready
         try:
-            mic_selectors = [
-                '//div[@aria-label="Turn off microphone"]',
-                '//button[@aria-label="Turn off microphone"]',
-            ]
-            for selector in mic_selectors:
-                try:
-                    mic_button = WebDriverWait(self.browser, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    mic_button.click()
-                    self.logger.info("Microphone disabled")
-                    break
-                except:
-                    continue
-        except Exception as e:
-            self.logger.warning(f"Mic disable issue: {e}")
+            self._wait10.until(EC.element_to_be_clickable((By.XPATH, MIC_OFF_XPATH)))
+        except WebDriverException as e:
+            self.logger.warning(f"Pre-join screen not ready: {e}")
 
-        # Disable camera
+        # Mic and camera are independent until the join click: one script turns both off
         try:
-            camera_selectors = [
-                '//div[@aria-label="Turn off camera"]',
-                '//button[@aria-label="Turn off camera"]',
-            ]
-            for selector in camera_selectors:
-                try:
-                    camera_button = WebDriverWait(self.browser, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    camera_button.click()
-                    self.logger.info("Camera disabled")
-                    break
-                except:
-                    continue
-        except Exception as e:
-            self.logger.warning(f"Camera disable issue: {e}")
+            prejoin = self.browser.execute_script(PREJOIN_JS) or {}
+        except WebDriverException as e:
+            self.logger.warning(f"Pre-join script failed: {e}")
+            prejoin = {}
+        self.logger.info(f"Pre-join script result: {prejoin}")
+
+        # Fall back to Selenium for whatever the script could not find
+        if not prejoin.get("mic"):
+            try:
+                mic_button = self._wait5.until(
+                    EC.element_to_be_clickable((By.XPATH, MIC_OFF_XPATH))
+                )
+                mic_button.click()
+                self.logger.info("Microphone disabled")
+            except WebDriverException as e:
+                self.logger.warning(f"Mic disable issue: {e}")
 
-        time.sleep(2)
+        if not prejoin.get("camera"):
+            try:
+                camera_button = self._wait5.until(
+                    EC.element_to_be_clickable((By.XPATH, CAMERA_OFF_XPATH))
+                )
+                camera_button.click()
+                self.logger.info("Camera disabled")
+            except WebDriverException as e:
+                self.logger.warning(f"Camera disable issue: {e}")
 
-        # Enter name
+        # Real key events, so the join button reliably gets enabled
         try:
-            name_selectors = [
-                "//input[@placeholder='Your name']",
-                "//input[@type='text' and @aria-label]",
-            ]
-            for selector in name_selectors:
-                try:
-                    name_input = WebDriverWait(self.browser, 5).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                    name_input.clear()
-                    name_input.send_keys(self.bot_name)
-                    self.logger.info(f"Entered bot name: {self.bot_name}")
-                    break
-                except:
-                    continue
-        except Exception as e:
+            name_input = self._wait5.until(
+                EC.presence_of_element_located((By.XPATH, NAME_INPUT_XPATH))
+            )
+            name_input.clear()
+            name_input.send_keys(self.bot_name)
+            self.logger.info(f"Entered bot name: {self.bot_name}")
+        except WebDriverException as e:
             self.logger.warning(f"Name input issue: {e}")
 
-        time.sleep(1)
-
         # Click join button
         try:
-            join_selectors = [
-                '//span[contains(text(), "Ask to join")]//parent::button',
-                '//button[contains(., "Ask to join")]',
-                '//span[contains(text(), "Join now")]//parent::button',
-                '//button[contains(., "Join now")]',
-            ]
-            for selector in join_selectors:
-                try:
-                    join_button = WebDriverWait(self.browser, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                    join_button.click()
-                    self.logger.info("Clicked join button")
-                    break
-                except:
-                    continue
-        except Exception as e:
+            # Usually already enabled after the pre-join step: one querySelectorAll scan, no polling
+            join_button = self.browser.execute_script(JOIN_BUTTON_JS)
+            if join_button is None:
+                join_button = self._wait5.until(
+                    EC.element_to_be_clickable((By.XPATH, JOIN_BUTTON_XPATH))
+                )
+            join_button.click()
+            self.logger.info("Clicked join button")
+        except WebDriverException as e:
             self.logger.error(f"Join button error: {e}")
             screenshot_path = save_screenshot(self.browser, "join_error")
             if screenshot_path:
                 self.logger.info(f"Screenshot: {screenshot_path}")
 
-        time.sleep(4)
+        # Wait until we are either admitted or in the lobby instead of a fixed pause
+        with suppress(TimeoutException):
+            self._wait10.until(
+                EC.presence_of_element_located((By.XPATH, ADMITTED_OR_LOBBY_XPATH))
+            )
 
     def check_admission(self) -> None:
         """Check if admitted."""
-        try:
-            admitted = WebDriverWait(self.browser, 5).until(
-                EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "u6vdEc")]'))
-            )
-            if admitted and not self.recording_started:
-                self.logger.info("Admitted! Starting recording...")
-                self.start_recording()
-                self.recording_started = True
-        except TimeoutException:
-            pass
+        # One CDP evaluation instead of a findElement round-trip through WebDriver
+        result = self.browser.execute_cdp_cmd('Runtime.evaluate', {
+            "expression": ADMITTED_EXPRESSION,
+            "returnByValue": True,
+        })
+        admitted = result.get("result", {}).get("value", False)
+        if admitted and not self.recording_started:
+            self.logger.info("Admitted! Starting recording...")
+            self.start_recording()
+            self.recording_started = True
+
+    def _spawn_ffmpeg(self, command: list[str]) -> subprocess.Popen:
+        """Start FFmpeg in its own process group."""
+        # Own process group, so a forced kill also takes down any children reading the sink
+        return subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
 
     def start_recording(self) -> None:
         """Start FFmpeg recording."""
@@ -275,18 +368,26 @@ class JoinGoogleMeet:
         output_audio_file = f'{self.output_file}.opus'
 
         if platform.system() == 'Darwin':
-            command = ["ffmpeg", "-f", "avfoundation", "-i", ":0", "-acodec", "libopus", "-b:a", "128k", "-ac", "1", "-ar", "48000", output_audio_file]
+            command = [
+                "ffmpeg", "-f", "avfoundation", "-i", ":0",
+                *RESAMPLE_ARGS, *OPUS_VOICE_ARGS, output_audio_file,
+            ]
         elif platform.system() == 'Linux':
-            command = ["ffmpeg", "-f", "pulse", "-i", "virtual-sink.monitor", "-acodec", "libopus", "-b:a", "256k", "-ac", "1", "-ar", "48000", output_audio_file]
+            command = [
+                "ffmpeg", "-f", "pulse", "-i", "virtual-sink.monitor",
+                *RESAMPLE_ARGS, *OPUS_VOICE_ARGS, output_audio_file,
+            ]
         else:
             self.logger.error("Unsupported OS")
             return
 
         try:
             self.event_start_time = datetime.now(timezone.utc)
-            self.recording_process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.recording_process = self._spawn_ffmpeg(command)
             self.recording_started = True
-            self.recording_start_time = time.perf_counter()
+            self.recording_start_time = time.monotonic()
+            # The file name never changes, so resolve it once for the upload
+            self._final_audio_path = Path(output_audio_file).resolve()
             self.logger.info(f"Recording started: {output_audio_file}")
         except Exception as e:
             self.logger.error(f"Recording error: {e}")
@@ -295,11 +396,14 @@ class JoinGoogleMeet:
         """Stop recording."""
         if self.recording_started and self.recording_process:
             self.logger.info("Stopping recording...")
-            self.recording_process.terminate()
+            # SIGINT lets ffmpeg flush the last Opus frames and write the trailer
+            self.recording_process.send_signal(signal.SIGINT)
             try:
-                self.recording_process.wait(timeout=10)
+                self.recording_process.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                self.recording_process.kill()
+                self.logger.warning("FFmpeg did not exit on SIGINT, killing")
+                os.killpg(os.getpgid(self.recording_process.pid), signal.SIGKILL)
+                self.recording_process.wait()
             self.logger.info("Recording stopped")
 
     def end_session(self) -> None:
@@ -310,34 +414,57 @@ class JoinGoogleMeet:
         self.session_ended = True
         self.logger.info("Ending session...")
 
-        try:
-            time.sleep(5)
+        # Browser teardown and the recording stop + upload are independent; overlap them
+        teardown = Thread(target=self._close_browser, daemon=True)
+        teardown.start()
 
-            if self.browser:
-                try:
-                    self.browser.quit()
-                    self.logger.info("Browser closed")
-                except:
-                    pass
+        # Warm the TLS connection to the upload host while ffmpeg finalizes the file
+        if self.recording_started and self.presigned_url_audio:
+            Thread(target=self._preconnect_upload_host, daemon=True).start()
 
+        try:
             self.stop_event.set()
-            if self.recording_started:
-                self.stop_recording()
-                if self.presigned_url_audio:
-                    self.upload_files()
+            self.stop_recording()
+            if self.recording_started and self.presigned_url_audio:
+                self.upload_files()
         except Exception as e:
             self.logger.error(f"Cleanup error: {e}")
         finally:
+            teardown.join()
             self.logger.info("Session ended")
 
+    def _close_browser(self) -> None:
+        """Quit the browser and remove its profile directory."""
+        try:
+            if self.browser:
+                self.browser.quit()
+                self.logger.info("Browser closed")
+        except Exception as e:
+            # A dead chromedriver fails with urllib3/connection errors, not WebDriverException
+            self.logger.warning(f"Browser quit issue: {e}")
+        finally:
+            # Throwaway profile; without this every meeting leaves a Chrome profile in /tmp
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def _preconnect_upload_host(self) -> None:
+        """Open a pooled connection to the upload host ahead of the PUT."""
+        parsed = urlparse(self.presigned_url_audio)
+        try:
+            # Any status will do (S3 answers 403); only the handshake matters
+            get_upload_session().head(f"{parsed.scheme}://{parsed.netloc}/", timeout=5)
+        except requests.RequestException as e:
+            self.logger.warning(f"Upload preconnect failed: {e}")
+
     def upload_files(self) -> None:
         """Upload files."""
         try:
             if self.presigned_url_audio:
-                full_path = audio_file_path(f"{self.output_file}.opus")
-                if full_path and os.path.exists(full_path):
-                    with open(full_path, 'rb') as file:
-                        response = requests.put(self.presigned_url_audio, data=file, headers={'Content-Type': 'audio/opus'})
+                full_path = self._final_audio_path
+                if full_path and full_path.is_file():
+                    with full_path.open('rb') as file:
+                        response = get_upload_session().put(
+                            self.presigned_url_audio, data=file, headers={'Content-Type': 'audio/opus'}
+                        )
                         response.raise_for_status()
                     self.logger.info("Audio uploaded")
         except Exception as e:
@@ -346,31 +473,39 @@ class JoinGoogleMeet:
     def monitor_meeting(self) -> None:
         """Monitor meeting."""
         self.logger.info("Monitoring meeting...")
-        start_time = time.perf_counter()
+        wait_deadline = time.monotonic() + self.max_waiting_time
 
         while not self.stop_event.is_set():
-            current_time = time.perf_counter()
-            elapsed = current_time - start_time
+            now = time.monotonic()
 
             if not self.recording_started:
-                if elapsed > self.max_waiting_time:
+                if now > wait_deadline:
                     self.logger.info(f"Max waiting time ({self.max_waiting_time}s) exceeded")
                     break
-            else:
-                recording_elapsed = current_time - self.recording_start_time
-                if recording_elapsed > self.min_record_time:
-                    self.logger.info(f"Min recording time ({self.min_record_time}s) reached")
-                    break
+            elif now > self.recording_start_time + self.min_record_time:
+                self.logger.info(f"Min recording time ({self.min_record_time}s) reached")
+                break
 
             try:
-                self.check_admission()
+                if self.recording_started:
+                    # Already admitted: a no-op round-trip that raises if the browser is gone
+                    self.browser.execute_script("return 1")
+                else:
+                    self.check_admission()
             except WebDriverException:
                 self.logger.error("Browser closed")
                 break
             except Exception as e:
                 self.logger.error(f"Monitoring error: {e}")
 
-            time.sleep(5)
+            # Poll quickly in the lobby so recording starts right after admission; afterwards
+            # wake for the liveness check or exactly when the recording time runs out
+            if self.recording_started:
+                remaining = self.recording_start_time + self.min_record_time - time.monotonic()
+                timeout = max(0.0, min(15.0, remaining))
+            else:
+                timeout = 1.0
+            self.stop_event.wait(timeout)
 
     def run(self) -> None:
         """Main run method."""
@@ -387,4 +522,24 @@ class JoinGoogleMeet:
             self.logger.info("Finalizing...")
             self.end_session()
 
-        self.logger.info("=== BOT COMPLETED ===")
\ No newline at end of file
+        self.logger.info("=== BOT COMPLETED ===")
+
+
+def run_bot_process(bot_kwargs: dict, stop_event) -> None:
+    """Process entry point: run a bot until it finishes or stop_event is set."""
+    logging.basicConfig(level=logging.INFO)
+    bot = JoinGoogleMeet(**bot_kwargs)
+
+    def wait_for_stop() -> None:
+        stop_event.wait()
+        # Only signal: end_session stays on the main thread, so the process can't exit
+        # while the recording is still being finalized and uploaded
+        bot.stop_event.set()
+
+    Thread(target=wait_for_stop, daemon=True).start()
+
+    try:
+        bot.run()
+    except GoogleMeetUIException:
+        # Already logged by run(); report failure through the exit code
+        raise SystemExit(1)
@@ -5,6 +5,8 @@ import tarfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+MEET_CODE_RE = re.compile(r"[a-z]{3}-[a-z]{4}-[a-z]{3}")
+
 
 def clean_meeting_link(url: str) -> str:
     """Clean and validate Google Meet link."""
@@ -15,9 +17,10 @@ def clean_meeting_link(url: str) -> str:
     if 'meet.google.com' in url:
         return url
 
-    # If it's just a code, construct the full URL
-    if len(url) == 12 and '-' in url:  # Format like: abc-defg-hij
-        return f"https://meet.google.com/{url}"
+    # If it's just a code, construct the full URL (codes are case-insensitive: ABC-DEFG-HIJ works too)
+    code = url.lower()
+    if MEET_CODE_RE.fullmatch(code):  # Format like: abc-defg-hij
+        return f"https://meet.google.com/{code}"
 
     return url
 
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,6 +13,8 @@ from scrum_master.modules.google_meet.application.interfaces import (
     IGoogleMeetAdapter, IMeetingRepository)
 from scrum_master.modules.google_meet.config import (GoogleMeetConfig,
                                                      GoogleMeetModuleConfig)
+from scrum_master.modules.google_meet.infrastructure.executors import \
+    get_meet_executor
 from scrum_master.modules.google_meet.infrastructure.repositories.meeting_repository import \
     MeetingRepository
 from scrum_master.modules.google_meet.infrastructure.selenium.meet_adapter import \
@@ -28,6 +32,10 @@ class GoogleMeetModuleProvider(Provider):
     ) -> GoogleMeetConfig:
         return config.google_meet
 
+    @provide(scope=Scope.APP)
+    def get_meet_executor(self, config: GoogleMeetConfig) -> ThreadPoolExecutor:
+        return get_meet_executor(config.max_workers)
+
     @provide(scope=Scope.REQUEST, provides=IMeetingRepository)
     def get_meeting_repository(self, session: AsyncSession) -> MeetingRepository:
         return MeetingRepository(session)
@@ -41,10 +49,12 @@ class GoogleMeetModuleProvider(Provider):
         self,
         meeting_repo: IMeetingRepository,
         google_meet_adapter: IGoogleMeetAdapter,
+        executor: ThreadPoolExecutor,
     ) -> ConnectToMeetInteractor:
         return ConnectToMeetInteractor(
             meeting_repository=meeting_repo,
             google_meet_adapter=google_meet_adapter,
+            executor=executor,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -52,10 +62,12 @@ class GoogleMeetModuleProvider(Provider):
         self,
         meeting_repo: IMeetingRepository,
         google_meet_adapter: IGoogleMeetAdapter,
+        executor: ThreadPoolExecutor,
     ) -> DisconnectFromMeetInteractor:
         return DisconnectFromMeetInteractor(
             meeting_repository=meeting_repo,
             google_meet_adapter=google_meet_adapter,
+            executor=executor,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -4,7 +4,8 @@ from typing import Annotated
 import httpx
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (APIRouter, Depends, Header, HTTPException, Response,
+                     status)
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from scrum_master.modules.auth.infrastructure.security.jwt_service import JWTService
@@ -32,6 +33,7 @@ async def trigger_bot(
     request: TriggerBotRequest,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     jwt_service: FromDishka[JWTService],
+    http_client: FromDishka[httpx.AsyncClient],
 ) -> TriggerBotResponse:
     try:
         token = credentials.credentials
@@ -40,39 +42,39 @@ async def trigger_bot(
 
         logger.info(f'User {user_id} triggering bot for meeting: {request.meet_url}')
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logger.info(f'Bot request: {request.meet_url} {request.bot_name}')
-            bot_request = {
-                'meetlink': request.meet_url,
-                'bot_name': request.bot_name,
-                'min_record_time': 1,
-                'max_waiting_time': 1800,
-            }
+        logger.info(f'Bot request: {request.meet_url} {request.bot_name}')
+        bot_request = {
+            'meetlink': request.meet_url,
+            'bot_name': request.bot_name,
+            'min_record_time': 1,
+            'max_waiting_time': 1800,
+        }
 
-            logger.info(f'Bot request: {bot_request}')
+        logger.info(f'Bot request: {bot_request}')
 
-            response = await client.post(
-                'http://host.docker.internal:8001/api/v1/bots/start',
-                json=bot_request
-            )
+        response = await http_client.post(
+            'http://host.docker.internal:8001/api/v1/bots/start',
+            json=bot_request,
+            timeout=30.0,
+        )
 
-            logger.info(f'!!! Bot response: {response.json()}')
-            response.raise_for_status()
-            bot_data = response.json()
+        logger.info(f'!!! Bot response: {response.json()}')
+        response.raise_for_status()
+        bot_data = response.json()
 
-            logger.info(f'!!! Bot started successfully: {bot_data.get("bot_id")}')
+        logger.info(f'!!! Bot started successfully: {bot_data.get("bot_id")}')
 
-            # Сохраняем статус бота в storage
-            storage = get_bot_status_storage()
-            await storage.create(bot_data['bot_id'], user_id, BotStatus.STARTING)
+        # Сохраняем статус бота в storage
+        storage = get_bot_status_storage()
+        await storage.create(bot_data['bot_id'], user_id, BotStatus.STARTING)
 
-            logger.info(f'!!! Bot status created: {bot_data["bot_id"]}')
+        logger.info(f'!!! Bot status created: {bot_data["bot_id"]}')
 
-            return TriggerBotResponse(
-                bot_id=bot_data['bot_id'],
-                status=bot_data['status'],
-                message=f'Bot {bot_data["bot_id"]} started successfully for meeting'
-            )
+        return TriggerBotResponse(
+            bot_id=bot_data['bot_id'],
+            status=bot_data['status'],
+            message=f'Bot {bot_data["bot_id"]} started successfully for meeting'
+        )
 
     except httpx.HTTPStatusError as e:
         logger.error(f'Failed to start bot: {e.response.text}')
@@ -104,8 +106,11 @@ async def trigger_bot(
 @inject
 async def get_bot_status(
     bot_id: str,
+    response: Response,
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     jwt_service: FromDishka[JWTService],
+    http_client: FromDishka[httpx.AsyncClient],
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> BotStatusResponse:
     """
     Эндпоинт для polling статуса бота.
@@ -131,31 +136,31 @@ async def get_bot_status(
 
         if not bot_info:
             # Пробуем получить статус из внешнего сервиса
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                try:
-                    response = await client.get(
-                        f'http://host.docker.internal:8001/api/v1/bots/{bot_id}'
-                    )
-                    response.raise_for_status()
-                    external_data = response.json()
-
-                    # Маппим внешний статус на наш
-                    external_status = external_data.get('status', '')
-                    if external_status == 'starting':
-                        internal_status = BotStatus.STARTING
-                    elif external_status == 'running':
-                        internal_status = BotStatus.RUNNING
-                    else:
-                        internal_status = BotStatus.STARTING
-
-                    # Создаем запись в storage
-                    bot_info = await storage.create(bot_id, user_id, internal_status)
-
-                except httpx.HTTPError:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f'Bot {bot_id} not found'
-                    )
+            try:
+                external_response = await http_client.get(
+                    f'http://host.docker.internal:8001/api/v1/bots/{bot_id}',
+                    timeout=10.0,
+                )
+                external_response.raise_for_status()
+                external_data = external_response.json()
+
+                # Маппим внешний статус на наш
+                external_status = external_data.get('status', '')
+                if external_status == 'starting':
+                    internal_status = BotStatus.STARTING
+                elif external_status == 'running':
+                    internal_status = BotStatus.RUNNING
+                else:
+                    internal_status = BotStatus.STARTING
+
+                # Создаем запись в storage
+                bot_info = await storage.create(bot_id, user_id, internal_status)
+
+            except httpx.HTTPError:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f'Bot {bot_id} not found'
+                )
 
         # Проверяем доступ пользователя к боту
         if bot_info.user_id != user_id:
@@ -164,6 +169,12 @@ async def get_bot_status(
                 detail='Access denied to this bot'
             )
 
+        # Статус не менялся с прошлого опроса - отдаём 304 без тела
+        etag = bot_info.etag()
+        if if_none_match == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        response.headers['ETag'] = etag
+
         return BotStatusResponse(**bot_info.to_dict())
 
     except ValueError as e:
@@ -1,76 +1,115 @@
+import asyncio
+import logging
+import random
+
 import httpx
 
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+MAX_BACKOFF = 60.0
+RETRYABLE_STATUS_CODES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+
+def _is_retryable(method: str, status_code: int) -> bool:
+    # 429 means the request was rejected before processing, so any method is safe
+    if status_code == 429:
+        return True
+    # A 5xx on POST may have created the issue already; don't duplicate it
+    return status_code in RETRYABLE_STATUS_CODES and method in IDEMPOTENT_METHODS
+
 
 class JiraClient:
-    def __init__(self, url: str, token: str):
+    def __init__(self, url: str, token: str, max_concurrency: int = 10):
         self.url = url.rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
         }
+        # Cap parallel calls so fan-out doesn't trip Jira rate limits
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # One pooled client, so calls and retries reuse keep-alive connections
+        self._client = httpx.AsyncClient(
+            base_url=self.url,
+            headers=self.headers,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
 
-    async def get_users(self) -> list[dict]:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(
-                f"{self.url}/rest/api/2/user/search",
-                params={"username": ".", "maxResults": 1000},
-                headers=self.headers
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        for attempt in range(MAX_ATTEMPTS):
+            async with self._semaphore:
+                r = await self._client.request(method, path, **kwargs)
+
+            if attempt == MAX_ATTEMPTS - 1 or not _is_retryable(method, r.status_code):
+                return r
+
+            # Exponential backoff with jitter, honouring Retry-After from Jira
+            delay = min(MAX_BACKOFF, 2 ** attempt + random.random())
+            retry_after = r.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+
+            logger.warning(
+                f"[JIRA CLIENT] {method} {path} returned {r.status_code}, "
+                f"retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})"
             )
+            await asyncio.sleep(delay)
+
+    async def get_users(self) -> list[dict]:
+        r = await self._request(
+            "GET",
+            "/rest/api/2/user/search",
+            params={"username": ".", "maxResults": 1000},
+        )
         r.raise_for_status()
         return r.json()
 
     async def get_boards(self) -> list[dict]:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(
-                f"{self.url}/rest/agile/1.0/board",
-                headers=self.headers
-            )
+        r = await self._request("GET", "/rest/agile/1.0/board")
         r.raise_for_status()
         return r.json().get("values", [])
 
-    async def get_board_issues(self, board_id: int) -> list[dict]:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(
-                f"{self.url}/rest/agile/1.0/board/{board_id}/issue",
-                params={"maxResults": 1000},
-                headers=self.headers,
-            )
+    async def get_board_issues(self, board_id: int, fields: list[str] | None = None) -> list[dict]:
+        params = {"maxResults": 1000}
+        # Let Jira drop fields the caller won't read (changelog, renderedFields, ...)
+        if fields:
+            params["fields"] = ",".join(fields)
+        r = await self._request(
+            "GET",
+            f"/rest/agile/1.0/board/{board_id}/issue",
+            params=params,
+        )
         r.raise_for_status()
         return r.json().get("issues", [])
 
     async def create_issue(self, payload: dict) -> dict:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"[JIRA CLIENT] Creating issue with payload: {payload}")
-        
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                f"{self.url}/rest/api/2/issue",
-                json=payload,
-                headers=self.headers
-            )
-        
+
+        r = await self._request("POST", "/rest/api/2/issue", json=payload)
+
         if r.status_code != 201:
             logger.error(f"[JIRA CLIENT] Failed to create issue. Status: {r.status_code}, Response: {r.text}")
-        
+
         r.raise_for_status()
         return r.json()
 
     async def update_issue(self, issue_key: str, fields: dict):
-        async with httpx.AsyncClient() as client:
-            r = await client.put(
-                f"{self.url}/rest/api/2/issue/{issue_key}",
-                json={"fields": fields},
-                headers=self.headers
-            )
+        r = await self._request(
+            "PUT",
+            f"/rest/api/2/issue/{issue_key}",
+            json={"fields": fields},
+        )
         r.raise_for_status()
         return {"status": "updated"}
 
     async def delete_issue(self, issue_key: str):
-        async with httpx.AsyncClient() as client:
-            r = await client.delete(
-                f"{self.url}/rest/api/2/issue/{issue_key}",
-                headers=self.headers
-            )
+        r = await self._request("DELETE", f"/rest/api/2/issue/{issue_key}")
         r.raise_for_status()
         return {"status": "deleted"}
@@ -16,8 +16,8 @@ class JiraService:
     async def get_boards(self):
         return await self.api.get_boards()
 
-    async def get_board_issues(self, board_id: int):
-        return await self.api.get_board_issues(board_id)
+    async def get_board_issues(self, board_id: int, fields: list[str] | None = None):
+        return await self.api.get_board_issues(board_id, fields)
 
     async def create_issue(self, dto: CreateIssueRequest):
         payload = {
@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterable
+
 from dishka import Provider, Scope, from_context, provide
 
 from scrum_master.modules.jira.infrastructure.jira.jira_client import JiraClient
@@ -9,11 +11,13 @@ class JiraProvider(Provider):
     settings = from_context(provides=Settings, scope=Scope.APP)
 
     @provide(scope=Scope.APP)
-    def get_jira_api(self, settings: Settings) -> JiraClient:
-        return JiraClient(
+    async def get_jira_api(self, settings: Settings) -> AsyncIterable[JiraClient]:
+        client = JiraClient(
             url=settings.jira.api_url,
             token=settings.jira.api_token.get_secret_value(),
         )
+        yield client
+        await client.aclose()
 
     @provide(scope=Scope.REQUEST)
     def get_jira_service(self, api: JiraClient) -> JiraService:
@@ -25,8 +25,12 @@ async def get_boards(service: FromDishka[JiraService]):
 
 @router.get("/boards/{board_id}/issues")
 @inject
-async def get_board_issues(board_id: int, service: FromDishka[JiraService]):
-    return await service.get_board_issues(board_id)
+async def get_board_issues(
+    board_id: int,
+    service: FromDishka[JiraService],
+    fields: str | None = None,
+):
+    return await service.get_board_issues(board_id, fields.split(",") if fields else None)
 
 
 @router.post("/issues")
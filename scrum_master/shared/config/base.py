@@ -22,6 +22,8 @@ class PostgresConfig(BaseSettings):
     user: str = 'postgres'
     password: SecretStr = SecretStr('postgres')
     database: str = 'scrum_master'
+    pool_size: int = 20
+    max_overflow: int = 10
 
     @property
     def url(self) -> str:
@@ -1,5 +1,6 @@
 from collections.abc import AsyncIterable
 
+import httpx
 from dishka import Provider, Scope, from_context, provide
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -26,10 +27,19 @@ class SharedInfrastructureProvider(Provider):
 
     @provide(scope=Scope.APP)
     async def get_redis(self, settings: Settings) -> AsyncIterable[Redis]:
-        redis = Redis.from_url(settings.redis.url, decode_responses=True)
+        redis = Redis.from_url(settings.redis.url, decode_responses=False)
         yield redis
         await redis.aclose()
 
+    @provide(scope=Scope.APP)
+    async def get_http_client(self) -> AsyncIterable[httpx.AsyncClient]:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        yield client
+        await client.aclose()
+
     @provide(scope=Scope.APP)
     def get_jwt_service(self, settings: Settings) -> JWTService:
         return JWTService(
@@ -7,8 +7,9 @@ from scrum_master.shared.config import PostgresConfig
 def new_session_maker(db_config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
     engine = create_async_engine(
         db_config.url,
-        pool_size=15,
-        max_overflow=15,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_pre_ping=True,
     )
     return async_sessionmaker(
         engine, class_=AsyncSession, autoflush=False, expire_on_commit=False